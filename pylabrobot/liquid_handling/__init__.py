@@ -1,4 +1,13 @@
-from .backends import *
+from typing import TYPE_CHECKING
+
+from . import backends
+from .backends import (
+  LiquidHandlerBackend,
+  ChatterBoxBackend,
+  SerializingBackend,
+  SerializingSavingBackend,
+  SaverBackend
+)
 from .liquid_handler import LiquidHandler
 from .standard import (
   Pickup,
@@ -12,3 +21,42 @@ from .standard import (
   Move
 )
 from .strictness import Strictness, set_strictness, get_strictness
+
+if TYPE_CHECKING:
+  from .backends import (
+    WebSocketBackend,
+    STAR,
+    Vantage,
+    HTTPBackend,
+    OpentronsBackend,
+    EVO
+  )
+
+__all__ = [
+  "backends",
+  "LiquidHandler",
+  "Pickup",
+  "Drop",
+  "PickupTipRack",
+  "DropTipRack",
+  "Aspiration",
+  "Dispense",
+  "AspirationPlate",
+  "DispensePlate",
+  "Move",
+  "Strictness",
+  "set_strictness",
+  "get_strictness",
+  *backends.__all__,
+]
+
+
+# hardware backends are imported lazily, see `backends/__init__.py`
+def __getattr__(name: str):
+  if name in backends.__all__:
+    return getattr(backends, name)
+  raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+  return sorted(set(globals()) | set(backends.__all__))
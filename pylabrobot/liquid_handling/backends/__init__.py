@@ -1,12 +1,48 @@
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .backend import LiquidHandlerBackend
 from .chatterbox_backend import ChatterBoxBackend
 from .serializing_backend import SerializingBackend, SerializingSavingBackend # many rely on this
-from .websocket import WebSocketBackend
-
-from .hamilton.STAR import STAR
-from .hamilton.vantage import Vantage
-from .http import HTTPBackend
-from .opentrons_backend import OpentronsBackend
 from .saver_backend import SaverBackend
 
-from .tecan.EVO import EVO
+# Hardware backends pull in firmware tables, HTTP/websocket clients and optional dependencies, so
+# they are only imported when first accessed (PEP 562).
+_LAZY_BACKENDS = {
+  "WebSocketBackend": ".websocket",
+  "STAR": ".hamilton.STAR",
+  "Vantage": ".hamilton.vantage",
+  "HTTPBackend": ".http",
+  "OpentronsBackend": ".opentrons_backend",
+  "EVO": ".tecan.EVO",
+}
+
+if TYPE_CHECKING:
+  from .websocket import WebSocketBackend
+  from .hamilton.STAR import STAR
+  from .hamilton.vantage import Vantage
+  from .http import HTTPBackend
+  from .opentrons_backend import OpentronsBackend
+  from .tecan.EVO import EVO
+
+__all__ = [
+  "LiquidHandlerBackend",
+  "ChatterBoxBackend",
+  "SerializingBackend",
+  "SerializingSavingBackend",
+  "SaverBackend",
+  *_LAZY_BACKENDS,
+]
+
+
+def __getattr__(name: str) -> Any:
+  if name not in _LAZY_BACKENDS:
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+  module = importlib.import_module(_LAZY_BACKENDS[name], __name__)
+  backend = getattr(module, name)
+  globals()[name] = backend
+  return backend
+
+
+def __dir__():
+  return sorted(set(globals()) | set(_LAZY_BACKENDS))
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABCMeta, abstractmethod
+import importlib
 from typing import List, Type, Optional
 
 from pylabrobot.machines.backends import MachineBackend
@@ -134,6 +135,11 @@ class LiquidHandlerBackend(MachineBackend, metaclass=ABCMeta):
       return None
 
     subclass = find_subclass(cls, data["type"])
+    if subclass is None:
+      # Hardware backends are imported lazily, so the subclass may not have been imported yet.
+      backends = importlib.import_module("pylabrobot.liquid_handling.backends")
+      if hasattr(backends, data["type"]):
+        subclass = find_subclass(cls, data["type"])
     if subclass is None:
       raise ValueError(f"Could not find subclass with name {data['type']}")
 
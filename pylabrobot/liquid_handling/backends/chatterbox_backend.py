@@ -1,5 +1,6 @@
 # pylint: disable=unused-argument
 
+import sys
 from typing import List
 
 from pylabrobot.liquid_handling.backends.backend import LiquidHandlerBackend
@@ -20,54 +21,80 @@ from pylabrobot.liquid_handling.standard import (
 class ChatterBoxBackend(LiquidHandlerBackend):
   """ Chatter box backend for 'How to Open Source' """
 
-  def __init__(self, num_channels: int = 8):
-    """ Initialize a chatter box backend. """
+  def __init__(self, num_channels: int = 8, verbose: bool = True):
+    """ Initialize a chatter box backend.
+
+    Args:
+      num_channels: The number of channels the simulated robot has.
+      verbose: If `False`, no output is produced. Messages are not formatted at all in this case.
+    """
     super().__init__()
     self._num_channels = num_channels
+    self._verbose = verbose
+
+  def serialize(self) -> dict:
+    return {
+      **super().serialize(),
+      "num_channels": self._num_channels,
+      "verbose": self._verbose,
+    }
+
+  def _log(self, message: str, *args):
+    """ Write a single line of output. Unlike `print`, this does one `write` call per line.
+
+    Like `logging`, `message` is only %-formatted with `args` when output is enabled, so the
+    (potentially expensive) reprs of operations are skipped when the backend is not verbose.
+    Like `print`, nothing is written when there is no `sys.stdout` (e.g. under pythonw).
+    """
+    if not self._verbose or sys.stdout is None:
+      return
+    if len(args) > 0:
+      message = message % args
+    sys.stdout.write(f"{message}\n")
 
   async def setup(self):
     await super().setup()
-    print("Setting up the robot.")
+    self._log("Setting up the robot.")
 
   async def stop(self):
     await super().stop()
-    print("Stopping the robot.")
+    self._log("Stopping the robot.")
 
   @property
   def num_channels(self) -> int:
     return self._num_channels
 
   async def assigned_resource_callback(self, resource: Resource):
-    print(f"Resource {resource.name} was assigned to the robot.")
+    self._log("Resource %s was assigned to the robot.", resource.name)
 
   async def unassigned_resource_callback(self, name: str):
-    print(f"Resource {name} was unassigned from the robot.")
+    self._log("Resource %s was unassigned from the robot.", name)
 
   async def pick_up_tips(self, ops: List[Pickup], use_channels: List[int], **backend_kwargs):
-    print(f"Picking up tips {ops}.")
+    self._log("Picking up tips %s.", ops)
 
   async def drop_tips(self, ops: List[Drop], use_channels: List[int], **backend_kwargs):
-    print(f"Dropping tips {ops}.")
+    self._log("Dropping tips %s.", ops)
 
   async def aspirate(self, ops: List[Aspiration], use_channels: List[int], **backend_kwargs):
-    print(f"Aspirating {ops}.")
+    self._log("Aspirating %s.", ops)
 
   async def dispense(self, ops: List[Dispense], use_channels: List[int], **backend_kwargs):
-    print(f"Dispensing {ops}.")
+    self._log("Dispensing %s.", ops)
 
   async def pick_up_tips96(self, pickup: PickupTipRack, **backend_kwargs):
-    print(f"Picking up tips from {pickup.resource.name}.")
+    self._log("Picking up tips from %s.", pickup.resource.name)
 
   async def drop_tips96(self, drop: DropTipRack, **backend_kwargs):
-    print(f"Dropping tips to {drop.resource.name}.")
+    self._log("Dropping tips to %s.", drop.resource.name)
 
   async def aspirate96(self, aspiration: AspirationPlate):
     plate = aspiration.wells[0].parent
-    print(f"Aspirating {aspiration.volume} from {plate}.")
+    self._log("Aspirating %s from %s.", aspiration.volume, plate)
 
   async def dispense96(self, dispense: DispensePlate):
     plate = dispense.wells[0].parent
-    print(f"Dispensing {dispense.volume} to {plate}.")
+    self._log("Dispensing %s to %s.", dispense.volume, plate)
 
   async def move_resource(self, move: Move, **backend_kwargs):
-    print(f"Moving {move}.")
+    self._log("Moving %s.", move)
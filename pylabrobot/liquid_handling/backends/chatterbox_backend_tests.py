@@ -1,6 +1,10 @@
+import contextlib
+import io
 import unittest
+import unittest.mock
 
 from pylabrobot.liquid_handling import LiquidHandler
+from pylabrobot.liquid_handling.backends.backend import LiquidHandlerBackend
 from pylabrobot.liquid_handling.backends.chatterbox_backend import ChatterBoxBackend
 from pylabrobot.resources import Cos_96_EZWash, HTF_L, Coordinate
 from pylabrobot.resources.hamilton import STARLetDeck
@@ -58,3 +62,38 @@ class ChatterBoxBackendTests(unittest.IsolatedAsyncioTestCase):
 
   async def test_move(self):
     await self.lh.move_resource(self.plate, Coordinate(0, 0, 0))
+
+  async def test_verbose_output(self):
+    with contextlib.redirect_stdout(io.StringIO()) as out:
+      await self.lh.move_resource(self.plate, Coordinate(0, 0, 0))
+    self.assertTrue(out.getvalue().startswith("Moving "))
+
+  async def test_not_verbose(self):
+    deck = STARLetDeck()
+    lh = LiquidHandler(ChatterBoxBackend(num_channels=8, verbose=False), deck=deck)
+    tip_rack = HTF_L(name="tip_rack")
+    deck.assign_child_resource(tip_rack, rails=3)
+    plate = Cos_96_EZWash(name="plate")
+    deck.assign_child_resource(plate, rails=9)
+
+    with contextlib.redirect_stdout(io.StringIO()) as out:
+      await lh.setup()
+      await lh.pick_up_tips(tip_rack["A1"])
+      await lh.move_resource(plate, Coordinate(0, 0, 0))
+      await lh.stop()
+    self.assertEqual(out.getvalue(), "")
+
+  async def test_no_stdout(self):
+    with unittest.mock.patch("sys.stdout", None):
+      await self.lh.pick_up_tips(self.tip_rack["A1"])
+      await self.lh.move_resource(self.plate, Coordinate(0, 0, 0))
+
+  def test_serialize(self):
+    backend = ChatterBoxBackend(num_channels=4, verbose=False)
+    serialized = backend.serialize()
+    self.assertEqual(serialized["num_channels"], 4)
+    self.assertEqual(serialized["verbose"], False)
+    deserialized = LiquidHandlerBackend.deserialize(backend.serialize())
+    self.assertIsInstance(deserialized, ChatterBoxBackend)
+    self.assertEqual(deserialized.num_channels, 4)
+    self.assertEqual(deserialized.serialize(), serialized)
@@ -1,5 +1,5 @@
 import sys
-from typing import Dict, Optional, List, cast
+from typing import Dict, Optional, List, Tuple, cast
 
 from pylabrobot.liquid_handling.backends.backend import LiquidHandlerBackend
 from pylabrobot.liquid_handling.errors import NoChannelError
@@ -12,7 +12,8 @@ from pylabrobot.liquid_handling.standard import (
   AspirationPlate,
   Dispense,
   DispensePlate,
-  Move
+  Move,
+  PipettingOp
 )
 from pylabrobot.resources import (
   Coordinate,
@@ -41,6 +42,39 @@ else:
 # https://forums.pylabrobot.org/t/connect-pylabrobot-to-ot2/2862/18
 _OT_DECK_IS_ADDRESSABLE_AREA_VERSION = "7.1.0"
 
+# Default flow rates in ul/s, data from https://archive.ph/ZUN9f
+_DEFAULT_ASPIRATION_FLOW_RATES: Dict[str, float] = {
+  "p300_multi_gen2": 94,
+  "p10_single": 5,
+  "p10_multi": 5,
+  "p50_single": 25,
+  "p50_multi": 25,
+  "p300_single": 150,
+  "p300_multi": 150,
+  "p1000_single": 500,
+
+  "p20_single_gen2": 3.78,
+  "p300_single_gen2": 46.43,
+  "p1000_single_gen2": 137.35,
+  "p20_multi_gen2": 7.6
+}
+
+_DEFAULT_DISPENSE_FLOW_RATES: Dict[str, float] = {
+  "p300_multi_gen2": 94,
+  "p10_single": 10,
+  "p10_multi": 10,
+  "p50_single": 50,
+  "p50_multi": 50,
+  "p300_single": 300,
+  "p300_multi": 300,
+  "p1000_single": 1000,
+
+  "p20_single_gen2": 7.56,
+  "p300_single_gen2": 92.86,
+  "p1000_single_gen2": 274.7,
+  "p20_multi_gen2": 7.6
+}
+
 
 class OpentronsBackend(LiquidHandlerBackend):
   """ Backends for the Opentrons liquid handling robots. Only supported on Python 3.10.
@@ -120,7 +154,7 @@ class OpentronsBackend(LiquidHandlerBackend):
     slot = None
     while resource.parent is not None:
       if isinstance(resource.parent, OTDeck):
-        slot = cast(OTDeck, resource.parent).get_slot(resource)
+        slot = resource.parent.get_slot(resource)
         break
       resource = resource.parent
     if slot is None:
@@ -157,15 +191,22 @@ class OpentronsBackend(LiquidHandlerBackend):
       await self.assigned_resource_callback(resource.tube_rack)
       return
 
-    well_names = [well.name for well in resource.children]
-    if isinstance(resource, ItemizedResource):
-      ordering = utils.reshape_2d(well_names, (resource.num_items_x, resource.num_items_y))
-    else:
-      ordering = [well_names]
+    # Use default values and only set the real ones if applicable. Like the tip length and overlap,
+    # the tip volume is taken from A1 for the whole rack, so only one tip is created.
+    tip_overlap: float = 0
+    total_tip_length: float = 0
+    tip_volume: Optional[float] = None
+    if isinstance(resource, TipRack):
+      tip = resource.get_tip("A1")
+      tip_overlap = tip.fitting_depth
+      total_tip_length = tip.total_tip_length
+      tip_volume = tip.maximal_volume
 
     def _get_volume(well: Resource) -> float:
       """ Temporary hack to get the volume of the well (in ul), TODO: store in resource. """
       if isinstance(well, TipSpot):
+        if tip_volume is not None:
+          return tip_volume
         return well.make_tip().maximal_volume
       return well.get_size_x() * well.get_size_y() * well.get_size_z()
 
@@ -177,12 +218,14 @@ class OpentronsBackend(LiquidHandlerBackend):
     else:
       display_category = "other"
 
-    well_definitions = {
-      child.name: {
+    well_definitions = {}
+    for child in resource.children:
+      location = cast(Coordinate, child.location)
+      well_definitions[child.name] = {
         "depth": child.get_size_z(),
-        "x": cast(Coordinate, child.location).x,
-        "y": cast(Coordinate, child.location).y,
-        "z": cast(Coordinate, child.location).z,
+        "x": location.x,
+        "y": location.y,
+        "z": location.z,
         "shape": "circular",
 
         # inscribed circle has diameter equal to the width of the well
@@ -190,23 +233,23 @@ class OpentronsBackend(LiquidHandlerBackend):
 
         # Opentrons requires `totalLiquidVolume`, even for tip racks!
         "totalLiquidVolume": _get_volume(child),
-      } for child in resource.children
-    }
+      }
+
+    # dicts keep insertion order, so these are the children's names in order
+    well_names = list(well_definitions)
+    if isinstance(resource, ItemizedResource):
+      ordering = utils.reshape_2d(well_names, (resource.num_items_x, resource.num_items_y))
+    else:
+      ordering = [well_names]
 
     format_ = "irregular" # Property to determine compatibility with multichannel pipette
     if isinstance(resource, ItemizedResource):
-      if resource.num_items_x * resource.num_items_y == 96:
+      num_items = resource.num_items_x * resource.num_items_y
+      if num_items == 96:
         format_ = "96Standard"
-      elif resource.num_items_x * resource.num_items_y == 384:
+      elif num_items == 384:
         format_ = "384Standard"
 
-    # Again, use default values and only set the real ones if applicable...
-    tip_overlap: float = 0
-    total_tip_length: float = 0
-    if isinstance(resource, TipRack):
-      tip_overlap = resource.get_tip("A1").fitting_depth
-      total_tip_length = resource.get_tip("A1").total_tip_length
-
     lw = {
       "schemaVersion": 2,
       "version": 1,
@@ -278,6 +321,12 @@ class OpentronsBackend(LiquidHandlerBackend):
     # instead, we move the labware off deck as a workaround
     ot_api.labware.move_labware(labware_id=name, off_deck=True)
 
+  def _get_offset(self, op: PipettingOp) -> Tuple[float, float, float]:
+    """ Get the (x, y, z) offset of an operation, or zeros if the operation has no offset. """
+    if op.offset is None:
+      return 0, 0, 0
+    return op.offset.x, op.offset.y, op.offset.z
+
   def select_tip_pipette(self, tip_max_volume: float, with_tip: bool) -> Optional[str]:
     """ Select a pipette based on maximum tip volume for tip pick up or drop.
 
@@ -295,12 +344,12 @@ class OpentronsBackend(LiquidHandlerBackend):
     if self.left_pipette is not None:
       left_volume = OpentronsBackend.pipette_name2volume[self.left_pipette["name"]]
       if left_volume == tip_max_volume and with_tip == self.left_pipette_has_tip:
-        return cast(str, self.left_pipette["pipetteId"])
+        return self.left_pipette["pipetteId"]
 
     if self.right_pipette is not None:
       right_volume = OpentronsBackend.pipette_name2volume[self.right_pipette["name"]]
       if right_volume == tip_max_volume and with_tip == self.right_pipette_has_tip:
-        return cast(str, self.right_pipette["pipetteId"])
+        return self.right_pipette["pipetteId"]
 
     return None
 
@@ -319,10 +368,7 @@ class OpentronsBackend(LiquidHandlerBackend):
     if not pipette_id:
       raise NoChannelError("No pipette channel of right type with no tip available.")
 
-    if op.offset is not None:
-      offset_x, offset_y, offset_z = op.offset.x, op.offset.y, op.offset.z
-    else:
-      offset_x = offset_y = offset_z = 0
+    offset_x, offset_y, offset_z = self._get_offset(op)
 
     # ad-hoc offset adjustment that makes it smoother.
     offset_z += 50
@@ -358,10 +404,7 @@ class OpentronsBackend(LiquidHandlerBackend):
     if not pipette_id:
       raise NoChannelError("No pipette channel of right type with tip available.")
 
-    if op.offset is not None:
-      offset_x, offset_y, offset_z = op.offset.x, op.offset.y, op.offset.z
-    else:
-      offset_x = offset_y = offset_z = 0
+    offset_x, offset_y, offset_z = self._get_offset(op)
 
     # ad-hoc offset adjustment that makes it smoother.
     offset_z += 10
@@ -397,12 +440,12 @@ class OpentronsBackend(LiquidHandlerBackend):
     if self.left_pipette is not None:
       left_volume = OpentronsBackend.pipette_name2volume[self.left_pipette["name"]]
       if left_volume >= volume and self.left_pipette_has_tip:
-        return cast(str, self.left_pipette["pipetteId"])
+        return self.left_pipette["pipetteId"]
 
     if self.right_pipette is not None:
       right_volume = OpentronsBackend.pipette_name2volume[self.right_pipette["name"]]
       if right_volume >= volume and self.right_pipette_has_tip:
-        return cast(str, self.right_pipette["pipetteId"])
+        return self.right_pipette["pipetteId"]
 
     return None
 
@@ -410,9 +453,9 @@ class OpentronsBackend(LiquidHandlerBackend):
     """ Get the name of a pipette from its id. """
 
     if self.left_pipette is not None and pipette_id == self.left_pipette["pipetteId"]:
-      return cast(str, self.left_pipette["name"])
+      return self.left_pipette["name"]
     if self.right_pipette is not None and pipette_id == self.right_pipette["pipetteId"]:
-      return cast(str, self.right_pipette["name"])
+      return self.right_pipette["name"]
     raise ValueError(f"Unknown pipette id: {pipette_id}")
 
   def _get_default_aspiration_flow_rate(self, pipette_name: str) -> float:
@@ -424,21 +467,7 @@ class OpentronsBackend(LiquidHandlerBackend):
       The default flow rate in ul/s.
     """
 
-    return {
-      "p300_multi_gen2": 94,
-      "p10_single": 5,
-      "p10_multi": 5,
-      "p50_single": 25,
-      "p50_multi": 25,
-      "p300_single": 150,
-      "p300_multi": 150,
-      "p1000_single": 500,
-
-      "p20_single_gen2": 3.78,
-      "p300_single_gen2": 46.43,
-      "p1000_single_gen2": 137.35,
-      "p20_multi_gen2": 7.6
-    }[pipette_name]
+    return _DEFAULT_ASPIRATION_FLOW_RATES[pipette_name]
 
   async def aspirate(self, ops: List[Aspiration], use_channels: List[int]):
     """ Aspirate liquid from the specified resource using pip. """
@@ -460,10 +489,7 @@ class OpentronsBackend(LiquidHandlerBackend):
 
     labware_id = self.defined_labware[op.resource.parent.name]
 
-    if op.offset is not None:
-      offset_x, offset_y, offset_z = op.offset.x, op.offset.y, op.offset.z
-    else:
-      offset_x = offset_y = offset_z = 0
+    offset_x, offset_y, offset_z = self._get_offset(op)
 
     ot_api.lh.aspirate(labware_id, well_name=op.resource.name, pipette_id=pipette_id,
       volume=volume, flow_rate=flow_rate, offset_x=offset_x, offset_y=offset_y, offset_z=offset_z)
@@ -477,21 +503,7 @@ class OpentronsBackend(LiquidHandlerBackend):
       The default flow rate in ul/s.
     """
 
-    return {
-      "p300_multi_gen2": 94,
-      "p10_single": 10,
-      "p10_multi": 10,
-      "p50_single": 50,
-      "p50_multi": 50,
-      "p300_single": 300,
-      "p300_multi": 300,
-      "p1000_single": 1000,
-
-      "p20_single_gen2": 7.56,
-      "p300_single_gen2": 92.86,
-      "p1000_single_gen2": 274.7,
-      "p20_multi_gen2": 7.6
-    }[pipette_name]
+    return _DEFAULT_DISPENSE_FLOW_RATES[pipette_name]
 
   async def dispense(self, ops: List[Dispense], use_channels: List[int]):
     """ Dispense liquid from the specified resource using pip. """
@@ -513,10 +525,7 @@ class OpentronsBackend(LiquidHandlerBackend):
 
     labware_id = self.defined_labware[op.resource.parent.name]
 
-    if op.offset is not None:
-      offset_x, offset_y, offset_z = op.offset.x, op.offset.y, op.offset.z
-    else:
-      offset_x = offset_y = offset_z = 0
+    offset_x, offset_y, offset_z = self._get_offset(op)
 
     ot_api.lh.dispense(labware_id, well_name=op.resource.name, pipette_id=pipette_id,
       volume=volume, flow_rate=flow_rate, offset_x=offset_x, offset_y=offset_y, offset_z=offset_z)
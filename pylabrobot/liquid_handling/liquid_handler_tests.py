@@ -126,6 +126,21 @@ class TestLiquidHandlerLayout(unittest.IsolatedAsyncioTestCase):
     with self.assertRaises(ResourceNotFoundError):
       self.lh.deck.get_resource("unknown resource")
 
+  def test_get_resource_through_liquid_handler(self):
+    plt_car = PLT_CAR_L5AC_A00(name="plate carrier")
+    plate = Cos_96_DW_1mL(name="aspiration plate")
+    plt_car[0] = plate
+    self.deck.assign_child_resource(plt_car, rails=10)
+
+    # The liquid handler should use the deck's index, not walk every well on the deck.
+    with unittest.mock.patch.object(self.deck, "get_resource",
+                                    wraps=self.deck.get_resource) as get_resource:
+      self.assertIs(self.lh.get_resource("aspiration plate"), plate)
+      self.assertIs(self.lh.get_resource(plate.get_item("A1").name), plate.get_item("A1"))
+      with self.assertRaises(ResourceNotFoundError):
+        self.lh.get_resource("unknown resource")
+    self.assertEqual(get_resource.call_count, 3)
+
   def test_subcoordinates(self):
     tip_car = TIP_CAR_480_A00(name="tip_carrier")
     tip_car[0] = STF_L(name="tip_rack_01")
@@ -692,3 +707,12 @@ class TestLiquidHandlerCallbacks(unittest.IsolatedAsyncioTestCase):
         "test_callback_not_registered_with_error",
         error=RuntimeError("test"),
       )
+
+
+class TestLiquidHandlingExports(unittest.TestCase):
+  def test_star_import(self):
+    namespace: Dict[str, Any] = {}
+    exec("from pylabrobot.liquid_handling import *", namespace) # pylint: disable=exec-used
+    for name in ["LiquidHandler", "ChatterBoxBackend", "STAR", "Vantage", "EVO",
+                 "OpentronsBackend", "HTTPBackend", "WebSocketBackend"]:
+      self.assertIn(name, namespace)
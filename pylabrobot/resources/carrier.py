@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
 
 from .coordinate import Coordinate
 from .resource import Resource
@@ -82,6 +82,12 @@ class Carrier(Resource):
 
     sites = sites or []
 
+    # Resources placed directly on a site, keyed by name. Kept up to date by the callbacks below so
+    # that looking up a carrier's resource by name does not have to search the whole subtree.
+    self._site_resources: Dict[str, Resource] = {}
+    self.register_did_assign_resource_callback(self._register_site_resource)
+    self.register_did_unassign_resource_callback(self._deregister_site_resource)
+
     self.sites: List[CarrierSite] = []
     for spot, site in enumerate(sites):
       site.name = f"carrier-{self.name}-spot-{spot}"
@@ -137,6 +143,33 @@ class Carrier(Resource):
       raise ValueError(f"Resource {resource} is not assigned to this carrier")
     resource.unassign()
 
+  def _register_site_resource(self, resource: Resource):
+    """ Callback called after a resource is assigned to this carrier or any of its descendants.
+    (did_assign_resource_callback) """
+
+    if isinstance(resource, CarrierSite) and resource.parent is self:
+      if resource.resource is not None:
+        self._site_resources[resource.resource.name] = resource.resource
+    elif isinstance(resource.parent, CarrierSite) and resource.parent.parent is self:
+      self._site_resources[resource.name] = resource
+
+  def _deregister_site_resource(self, resource: Resource):
+    """ Callback called after a resource is unassigned from this carrier or any of its descendants.
+    (did_unassign_resource_callback) """
+
+    if isinstance(resource, CarrierSite) and resource.resource is not None:
+      resource = resource.resource
+    if self._site_resources.get(resource.name) is resource:
+      del self._site_resources[resource.name]
+
+  def get_resource(self, name: str) -> Resource:
+    """ Get a resource by name. Resources placed directly on a site are found in O(1), other
+    resources are searched for in the tree. See :meth:`~Resource.get_resource`. """
+
+    if name in self._site_resources:
+      return self._site_resources[name]
+    return super().get_resource(name)
+
   def __getitem__(self, idx: int) -> CarrierSite:
     """ Get a site by index. """
     if not 0 <= idx < self.capacity:
@@ -121,6 +121,21 @@ class CarrierTests(unittest.TestCase):
     self.assertIsNone(self.tip_car[3].resource)
     self.assertIsNone(self.tip_car[4].resource)
 
+  def test_get_resource_by_name(self):
+    self.tip_car[0] = self.A
+    self.tip_car[1] = self.B
+    self.assertIs(self.tip_car.get_resource("A"), self.A)
+    self.assertIs(self.tip_car.get_resource("B"), self.B)
+    self.assertIs(self.tip_car.get_resource("tip_car"), self.tip_car)
+
+    del self.tip_car[0]
+    with self.assertRaises(ResourceNotFoundError):
+      self.tip_car.get_resource("A")
+
+    # resources on sites of a deserialized carrier should also be found
+    deserialized = Carrier.deserialize(self.tip_car.serialize())
+    self.assertEqual(deserialized.get_resource("B"), self.B)
+
   def test_unassign_carrier_site(self):
     pass
 
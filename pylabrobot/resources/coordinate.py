@@ -1,22 +1,31 @@
 from __future__ import annotations
-from dataclasses import dataclass
 
 
-@dataclass
 class Coordinate:
   """ Represents coordinates. This is often used to represent the location of a :class:`~Resource`,
   relative to its parent resource.
   """
 
-  x: float = 0
-  y: float = 0
-  z: float = 0
+  # Coordinates are created in large numbers (every resource, well and tip spot has one), so they
+  # do not carry a `__dict__`.
+  __slots__ = ("x", "y", "z")
 
-  def __post_init__(self):
+  def __init__(self, x: float = 0, y: float = 0, z: float = 0):
     # Round to 4 decimal places to minimize floating point errors (100nm)
-    self.x = round(self.x, 4)
-    self.y = round(self.y, 4)
-    self.z = round(self.z, 4)
+    self.x = round(x, 4)
+    self.y = round(y, 4)
+    self.z = round(z, 4)
+
+  def __eq__(self, other) -> bool:
+    if other.__class__ is not self.__class__:
+      return NotImplemented
+    return self.x == other.x and self.y == other.y and self.z == other.z
+
+  def __repr__(self) -> str:
+    return f"Coordinate(x={self.x!r}, y={self.y!r}, z={self.z!r})"
+
+  def serialize(self) -> dict:
+    return {"x": self.x, "y": self.y, "z": self.z, "type": "Coordinate"}
 
   @classmethod
   def zero(cls) -> Coordinate:
@@ -83,9 +83,10 @@ class Deck(Resource):
     Raises:
       ResourceNotFoundError: If the resource is not found.
     """
-    if not self.has_resource(name):
-      raise ResourceNotFoundError(f"Resource '{name}' not found")
-    return self.resources[name]
+    try:
+      return self.resources[name]
+    except KeyError as e:
+      raise ResourceNotFoundError(f"Resource '{name}' not found") from e
 
   def has_resource(self, name: str) -> bool:
     """ Returns True if the deck has a resource with the given name. """
@@ -123,10 +124,9 @@ class Deck(Resource):
 
   def summary(self) -> str:
     """ Returns a summary of the deck layout. """
-    summary_ = f"Deck: {self.get_size_x()} x {self.get_size_y()} mm\n\n"
-    for resource in self.children:
-      summary_ += f"{resource.name}: {resource}\n"
-    return summary_
+    lines = [f"Deck: {self.get_size_x()} x {self.get_size_y()} mm", ""]
+    lines.extend(f"{resource.name}: {resource}" for resource in self.children)
+    return "\n".join(lines) + "\n"
 
   def get_trash_area96(self) -> Trash:
     deck_class = self.__class__.__name__
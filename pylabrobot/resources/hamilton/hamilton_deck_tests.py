@@ -11,12 +11,36 @@ from pylabrobot.resources.ml_star import STF_L, HTF_L, TIP_CAR_480_A00, PLT_CAR_
 from pylabrobot.resources.resource import Resource
 
 
+_EXPECTED_SUMMARY = textwrap.dedent("""
+  Rail     Resource                   Type                Coordinates (mm)
+  ==============================================================================================
+  (-13) ├── trash_core96               Trash               (-232.100, 110.300, 189.000)
+        │
+  (1)   ├── tip_carrier                TipCarrier          (100.000, 063.000, 100.000)
+        │   ├── tip_rack_01            TipRack             (117.900, 145.800, 164.450)
+        │   ├── tip_rack_02            TipRack             (117.900, 241.800, 164.450)
+        │   ├── <empty>
+        │   ├── tip_rack_04            TipRack             (117.900, 433.800, 131.450)
+        │   ├── <empty>
+        │
+  (21)  ├── plate carrier              PlateCarrier        (550.000, 063.000, 100.000)
+        │   ├── aspiration plate       Plate               (568.000, 146.000, 187.150)
+        │   ├── <empty>
+        │   ├── dispense plate         Plate               (568.000, 338.000, 188.150)
+        │   ├── <empty>
+        │   ├── <empty>
+        │
+  (32)  ├── trash                      Trash               (800.000, 190.600, 137.100)
+  """)[1:]
+
+
 class HamiltonDeckTests(unittest.TestCase):
   """ Tests for the HamiltonDeck class. """
 
   def test_parse_lay_file(self):
     fn = "./pylabrobot/testing/test_data/test_deck.lay"
-    deck = HamiltonSTARDeck.load_from_lay_file(fn)
+    with self.assertWarns(DeprecationWarning):
+      deck = HamiltonSTARDeck.load_from_lay_file(fn)
 
     tip_car = deck.get_resource("TIP_CAR_480_A00_0001")
     assert isinstance(tip_car, TipCarrier)
@@ -97,24 +121,4 @@ class HamiltonDeckTests(unittest.TestCase):
   def test_summary(self):
     self.maxDiff = None
     deck = self.build_layout()
-    self.assertEqual(deck.summary(), textwrap.dedent("""
-    Rail     Resource                   Type                Coordinates (mm)
-    ==============================================================================================
-    (-13) ├── trash_core96               Trash               (-232.100, 110.300, 189.000)
-          │
-    (1)   ├── tip_carrier                TipCarrier          (100.000, 063.000, 100.000)
-          │   ├── tip_rack_01            TipRack             (117.900, 145.800, 164.450)
-          │   ├── tip_rack_02            TipRack             (117.900, 241.800, 164.450)
-          │   ├── <empty>
-          │   ├── tip_rack_04            TipRack             (117.900, 433.800, 131.450)
-          │   ├── <empty>
-          │
-    (21)  ├── plate carrier              PlateCarrier        (550.000, 063.000, 100.000)
-          │   ├── aspiration plate       Plate               (568.000, 146.000, 187.150)
-          │   ├── <empty>
-          │   ├── dispense plate         Plate               (568.000, 338.000, 188.150)
-          │   ├── <empty>
-          │   ├── <empty>
-          │
-    (32)  ├── trash                      Trash               (800.000, 190.600, 137.100)
-    """[1:]))
+    self.assertEqual(deck.summary(), _EXPECTED_SUMMARY)
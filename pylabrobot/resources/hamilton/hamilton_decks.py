@@ -4,6 +4,7 @@ from abc import ABCMeta, abstractmethod
 import inspect
 import logging
 from typing import Optional, cast
+import warnings
 
 from pylabrobot.resources.coordinate import Coordinate
 from pylabrobot.resources.carrier import Carrier
@@ -12,7 +13,6 @@ from pylabrobot.resources.plate import Plate
 from pylabrobot.resources.resource import Resource
 from pylabrobot.resources.tip_rack import TipRack
 from pylabrobot.resources.trash import Trash
-import pylabrobot.utils.file_parsing as file_parser
 
 
 logger = logging.getLogger("pylabrobot")
@@ -128,22 +128,22 @@ class HamiltonDeck(Deck, metaclass=ABCMeta):
         raise ValueError(f"Resource with width {resource.get_size_x()} does not "
                         f"fit at rails {rails}.")
 
-      # Check if there is space for this new resource.
+      # Check if there is space for this new resource. The extents of the new resource are computed
+      # once, and the y extents of an existing resource are only looked at when the x extents
+      # overlap, which is rare on a deck where resources are placed on distinct rails.
+      x, y = resource_location.x, resource_location.y
+      x_end, y_end = x + resource.get_size_x(), y + resource.get_size_y()
       for og_resource in self.children:
-        og_x = cast(Coordinate, og_resource.location).x
-        og_y = cast(Coordinate, og_resource.location).y
+        og_location = cast(Coordinate, og_resource.location)
+        og_x, og_y = og_location.x, og_location.y
 
         # A resource is not allowed to overlap with another resource. Resources overlap when a
         # corner of one resource is inside the boundaries of another resource.
-        if any([
-          og_x <= resource_location.x < og_x + og_resource.get_size_x(),
-          og_x < resource_location.x + resource.get_size_x() < og_x + og_resource.get_size_x()
-          ]) and any(
-            [
-              og_y <= resource_location.y < og_y + og_resource.get_size_y(),
-              og_y < resource_location.y + resource.get_size_y() < og_y + og_resource.get_size_y()
-            ]
-          ):
+        og_x_end = og_x + og_resource.get_size_x()
+        if not (og_x <= x < og_x_end or og_x < x_end < og_x_end):
+          continue
+        og_y_end = og_y + og_resource.get_size_y()
+        if og_y <= y < og_y_end or og_y < y_end < og_y_end:
           raise ValueError(f"Location {resource_location} is already occupied by resource "
                             f"'{og_resource.name}'.")
 
@@ -162,10 +162,20 @@ class HamiltonDeck(Deck, metaclass=ABCMeta):
 
       >>> from pylabrobot.resources.hamilton import HamiltonDeck
       >>> deck = HamiltonSTARDeck.load_from_lay_file("deck.lay")
+
+    .. deprecated:: 0.1.6
+      .lay files reference VENUS resources, many of which are not defined in PyLabRobot. Build the
+      layout in Python, or save and load it as JSON using :meth:`~Resource.save` and
+      :meth:`~Resource.load_from_json_file`.
     """
 
+    warnings.warn("HamiltonDeck.load_from_lay_file is deprecated and will be removed in a future "
+                  "version. Use Resource.save and Resource.load_from_json_file instead.",
+                  DeprecationWarning, stacklevel=2)
+
     # pylint: disable=import-outside-toplevel, cyclic-import
     import pylabrobot.resources as resources_module
+    import pylabrobot.utils.file_parsing as file_parser
 
     c = None
     with open(fn, "r", encoding="ISO-8859-1") as f:
@@ -253,51 +263,51 @@ class HamiltonDeck(Deck, metaclass=ABCMeta):
            │   ├── tip_rack_01            STF_L               (x: 117.900, y: 240.000, z: 100.000)
     """
 
-    if len(self.get_all_resources()) == 0:
+    if len(self.resources) == 0:
       raise ValueError(
           "This liquid editor does not have any resources yet. "
           "Build a layout first by calling `assign_child_resource()`. "
       )
 
-    # Print header.
-    summary_ = "Rail" + " " * 5 + "Resource" + " " * 19 +  "Type" + " " * 16 + "Coordinates (mm)\n"
-    summary_ += "=" * 94 + "\n"
+    # Lines are collected in a list and joined once at the end.
+    lines = [
+      "Rail" + " " * 5 + "Resource" + " " * 19 +  "Type" + " " * 16 + "Coordinates (mm)",
+      "=" * 94,
+    ]
 
     def parse_resource(resource):
       # TODO: print something else if resource is not assigned to a rails.
       rails = _rails_for_x_coordinate(resource.location.x)
       rail_label = f"({rails})" if rails is not None else "      "
-      r_summary = f"{rail_label:5} ├── {resource.name:27}" + \
-            f"{resource.__class__.__name__:20}" + \
-            f"{resource.get_absolute_location()}\n"
+      lines.append(f"{rail_label:5} ├── {resource.name:27}"
+                   f"{resource.__class__.__name__:20}"
+                   f"{resource.get_absolute_location()}")
 
       if isinstance(resource, Carrier):
         for site in resource.get_sites():
           if site.resource is None:
-            r_summary += "      │   ├── <empty>\n"
+            lines.append("      │   ├── <empty>")
           else:
             subresource = site.resource
             if isinstance(subresource, (TipRack, Plate)):
-              location = subresource.get_item("A1").get_absolute_location() + \
-                subresource.get_item("A1").center()
+              a1 = subresource.get_item("A1")
+              location = a1.get_absolute_location() + a1.center()
             else:
               location = subresource.get_absolute_location()
-            r_summary += f"      │   ├── {subresource.name:23}" + \
-                  f"{subresource.__class__.__name__:20}" + \
-                  f"{location}\n"
-
-      return r_summary
+            lines.append(f"      │   ├── {subresource.name:23}"
+                         f"{subresource.__class__.__name__:20}"
+                         f"{location}")
 
     # Sort resources by rails, left to right in reality.
     sorted_resources = sorted(self.children, key=lambda r: r.get_absolute_location().x)
 
     # Print table body.
-    summary_ += parse_resource(sorted_resources[0])
+    parse_resource(sorted_resources[0])
     for resource in sorted_resources[1:]:
-      summary_ += "      │\n"
-      summary_ += parse_resource(resource)
+      lines.append("      │")
+      parse_resource(resource)
 
-    return summary_
+    return "\n".join(lines) + "\n"
 
 
 class HamiltonSTARDeck(HamiltonDeck): # pylint: disable=invalid-name
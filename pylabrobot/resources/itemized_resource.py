@@ -383,7 +383,9 @@ class ItemizedResource(Resource, Generic[T], metaclass=ABCMeta):
     """ Get all items in the resource. Items are in a 1D list, starting from the top left and going
     down, then right. """
 
-    return self.get_items(range(self.num_items))
+    # Items are the first `num_items` children (see get_item), so there is no need to look up and
+    # range check every index individually.
+    return cast(List[T], self.children[:self.num_items])
 
 
 def create_equally_spaced(
@@ -415,16 +417,20 @@ def create_equally_spaced(
 
   # TODO: It probably makes more sense to transpose this.
 
+  # The grid is regular, so compute the name prefix and the column and row offsets only once.
+  prefix = klass.__name__.lower()
+  xs = [dx + i * item_dx for i in range(num_items_x)]
+  ys = [dy + (num_items_y-j-1) * item_dy for j in range(num_items_y)]
+
   items: List[List[T]] = []
-  for i in range(num_items_x):
+  for i, x in enumerate(xs):
     items.append([])
-    for j in range(num_items_y):
-      name = f"{klass.__name__.lower()}_{i}_{j}"
+    for j, y in enumerate(ys):
       item = klass(
-        name=name,
+        name=f"{prefix}_{i}_{j}",
         **kwargs
       )
-      item.location=Coordinate(x=dx + i * item_dx, y=dy + (num_items_y-j-1) * item_dy, z=dz)
+      item.location=Coordinate(x=x, y=y, z=dz)
       items[i].append(item)
 
   return items
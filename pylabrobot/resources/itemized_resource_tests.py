@@ -46,6 +46,16 @@ class TestItemizedResource(unittest.TestCase):
     self.assertEqual(self.plate.get_item((0, 0)).name, "plate_well_0_0")
     self.assertEqual(self.plate.get_item((7, 11)).name, "plate_well_11_7")
 
+  def test_get_all_items(self):
+    plate = Plate("plate", size_x=1, size_y=1, size_z=1, lid_height=10, with_lid=True,
+      items=create_equally_spaced(Well,
+      num_items_x=3, num_items_y=2,
+      dx=0, dy=0, dz=0,
+      item_dx=9, item_dy=9,
+      size_x=9, size_y=9, size_z=9))
+    self.assertEqual([well.name for well in plate.get_all_items()],
+      [f"plate_well_{i}_{j}" for i in range(3) for j in range(2)])
+
   def test_well_get_absolute_location(self):
     self.assertEqual(self.plate.get_item(0).get_absolute_location(),
       Coordinate(0, 63, 0))
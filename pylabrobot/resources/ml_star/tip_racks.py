@@ -18,6 +18,13 @@ from .tip_creators import (
 )
 
 
+def _portrait(tip_rack: TipRack) -> TipRack:
+  """ Rotate a newly created landscape tip rack to portrait orientation. Nothing else references the
+  rack yet, so it is rotated in place rather than copied like :meth:`Resource.rotated` does. """
+  tip_rack.rotate(90)
+  return tip_rack
+
+
 #: Tip Rack 24x 4ml Tip with Filter landscape oriented
 def FourmlTF_L(name: str, with_tips: bool = True) -> TipRack:
   return TipRack(
@@ -44,7 +51,7 @@ def FourmlTF_L(name: str, with_tips: bool = True) -> TipRack:
 
 #: Tip Rack 24x 4ml Tip with Filter portrait oriented
 def FourmlTF_P(name: str, with_tips: bool = True) -> TipRack:
-  return FourmlTF_L(name=name, with_tips=with_tips).rotated(90)
+  return _portrait(FourmlTF_L(name=name, with_tips=with_tips))
 
 
 #: Tip Rack 24x 5ml Tip landscape oriented
@@ -73,7 +80,7 @@ def FivemlT_L(name: str, with_tips: bool = True) -> TipRack:
 
 #: Tip Rack 24x 5ml Tip portrait oriented
 def FivemlT_P(name: str, with_tips: bool = True) -> TipRack:
-  return FivemlT_L(name=name, with_tips=with_tips).rotated(90)
+  return _portrait(FivemlT_L(name=name, with_tips=with_tips))
 
 
 #: Rack with 96 1000ul High Volume Tip with filter
@@ -102,7 +109,7 @@ def HTF_L(name: str, with_tips: bool = True) -> TipRack:
 
 #: Rack with 96 1000ul High Volume Tip with filter (portrait)
 def HTF_P(name: str, with_tips: bool = True) -> TipRack:
-  return HTF_L(name=name, with_tips=with_tips).rotated(90)
+  return _portrait(HTF_L(name=name, with_tips=with_tips))
 
 
 #: Rack with 96 1000ul High Volume Tip
@@ -131,7 +138,7 @@ def HT_L(name: str, with_tips: bool = True) -> TipRack:
 
 #: Rack with 96 1000ul High Volume Tip (portrait)
 def HT_P(name: str, with_tips: bool = True) -> TipRack:
-  return HT_L(name=name, with_tips=with_tips).rotated(90)
+  return _portrait(HT_L(name=name, with_tips=with_tips))
 
 
 #: Rack with 96 10ul Low Volume Tip with filter
@@ -160,7 +167,7 @@ def LTF_L(name: str, with_tips: bool = True) -> TipRack:
 
 #: Rack with 96 10ul Low Volume Tip with filter (portrait)
 def LTF_P(name: str, with_tips: bool = True) -> TipRack:
-  return LTF_L(name=name, with_tips=with_tips).rotated(90)
+  return _portrait(LTF_L(name=name, with_tips=with_tips))
 
 
 #: Rack with 96 10ul Low Volume Tip
@@ -189,7 +196,7 @@ def LT_L(name: str, with_tips: bool = True) -> TipRack:
 
 #: Rack with 96 10ul Low Volume Tip (portrait)
 def LT_P(name: str, with_tips: bool = True) -> TipRack:
-  return LT_L(name=name, with_tips=with_tips).rotated(90)
+  return _portrait(LT_L(name=name, with_tips=with_tips))
 
 
 #: Rack with 96 300ul Standard Volume Tip with filter
@@ -218,7 +225,7 @@ def STF_L(name: str, with_tips: bool = True) -> TipRack:
 
 #: Rack with 96 300ul Standard Volume Tip with filter (portrait)
 def STF_P(name: str, with_tips: bool = True) -> TipRack:
-  return STF_L(name=name, with_tips=with_tips).rotated(90)
+  return _portrait(STF_L(name=name, with_tips=with_tips))
 
 
 #: Rack with 96 300ul Standard Volume Tip
@@ -247,7 +254,7 @@ def ST_L(name: str, with_tips: bool = True) -> TipRack:
 
 #: Rack with 96 300ul Standard Volume Tip (portrait)
 def ST_P(name: str, with_tips: bool = True) -> TipRack:
-  return ST_L(name=name, with_tips=with_tips).rotated(90)
+  return _portrait(ST_L(name=name, with_tips=with_tips))
 
 
 #: Rack with 96 50ul Tip with filter
@@ -276,7 +283,7 @@ def TIP_50ul_w_filter_L(name: str, with_tips: bool = True) -> TipRack:
 
 #: Tip Rack 96 50ul Tip with filter portrait oriented
 def TIP_50ul_w_filter_P(name: str, with_tips: bool = True) -> TipRack:
-  return TIP_50ul_w_filter_L(name=name, with_tips=with_tips).rotated(90)
+  return _portrait(TIP_50ul_w_filter_L(name=name, with_tips=with_tips))
 
 
 #: Rack with 96 50ul Tip
@@ -305,4 +312,4 @@ def TIP_50ul_L(name: str, with_tips: bool = True) -> TipRack:
 
 #: Tip Rack 96 50ul Tip portrait oriented
 def TIP_50ul_P(name: str, with_tips: bool = True) -> TipRack:
-  return TIP_50ul_L(name=name, with_tips=with_tips).rotated(90)
+  return _portrait(TIP_50ul_L(name=name, with_tips=with_tips))
@@ -7,6 +7,30 @@ from pylabrobot.resources.resource import Resource
 from pylabrobot.resources.trash import Trash
 
 
+# Dedented once at import; holes {0}..{11} are the names of slots 1..12.
+_SUMMARY_TEMPLATE = textwrap.dedent("""
+  Deck: {size_x}mm x {size_y}mm
+
+  +-----------------+-----------------+-----------------+
+  |                 |                 |                 |
+  | 10: {9} | 11: {10} | 12: {11} |
+  |                 |                 |                 |
+  +-----------------+-----------------+-----------------+
+  |                 |                 |                 |
+  |  7: {6} |  8: {7} |  9: {8} |
+  |                 |                 |                 |
+  +-----------------+-----------------+-----------------+
+  |                 |                 |                 |
+  |  4: {3} |  5: {4} |  6: {5} |
+  |                 |                 |                 |
+  +-----------------+-----------------+-----------------+
+  |                 |                 |                 |
+  |  1: {0} |  2: {1} |  3: {2} |
+  |                 |                 |                 |
+  +-----------------+-----------------+-----------------+
+""")
+
+
 class OTDeck(Deck):
   """ The OpenTron deck. """
 
@@ -86,7 +110,7 @@ class OTDeck(Deck):
 
   def assign_child_at_slot(self, resource: Resource, slot: int):
     # pylint: disable=arguments-renamed
-    if slot not in range(1, 13):
+    if not 1 <= slot <= 12:
       raise ValueError("slot must be between 1 and 12")
 
     if self.slots[slot-1] is not None:
@@ -96,18 +120,20 @@ class OTDeck(Deck):
     super().assign_child_resource(resource, location=self.slot_locations[slot-1])
 
   def unassign_child_resource(self, resource: Resource):
-    if resource not in self.slots:
+    slot = self.get_slot(resource)
+    if slot is None:
       raise ValueError(f"Resource {resource.name} is not assigned to this deck")
 
-    slot = self.slots.index(resource)
-    self.slots[slot] = None
+    self.slots[slot-1] = None
     super().unassign_child_resource(resource)
 
   def get_slot(self, resource: Resource) -> Optional[int]:
     """ Get the slot number of a resource. """
-    if resource not in self.slots:
-      return None
-    return self.slots.index(resource) + 1
+    # Compare by identity: `in` and `index` use Resource.__eq__, which compares the whole subtree.
+    for i, slot_resource in enumerate(self.slots):
+      if slot_resource is resource:
+        return i + 1
+    return None
 
   def summary(self) -> str:
     """ Get a summary of the deck.
@@ -135,10 +161,9 @@ class OTDeck(Deck):
     +-----------------+-----------------+-----------------+
     """
 
-    def _get_slot_name(slot: int) -> str:
+    def _get_slot_name(resource: Optional[Resource]) -> str:
       """ Get slot name, or 'Empty' if slot is empty. If the name is too long, truncate it. """
       length = 11
-      resource = self.slots[slot]
       if resource is None:
         return "Empty".ljust(length)
       name = resource.name
@@ -146,26 +171,5 @@ class OTDeck(Deck):
         name = name[:8] + "..."
       return name.ljust(length)
 
-    summary_ = f"""
-      Deck: {self.get_size_x()}mm x {self.get_size_y()}mm
-
-      +-----------------+-----------------+-----------------+
-      |                 |                 |                 |
-      | 10: {_get_slot_name(9)} | 11: {_get_slot_name(10)} | 12: {_get_slot_name(11)} |
-      |                 |                 |                 |
-      +-----------------+-----------------+-----------------+
-      |                 |                 |                 |
-      |  7: {_get_slot_name(6)} |  8: {_get_slot_name(7)} |  9: {_get_slot_name(8)} |
-      |                 |                 |                 |
-      +-----------------+-----------------+-----------------+
-      |                 |                 |                 |
-      |  4: {_get_slot_name(3)} |  5: {_get_slot_name(4)} |  6: {_get_slot_name(5)} |
-      |                 |                 |                 |
-      +-----------------+-----------------+-----------------+
-      |                 |                 |                 |
-      |  1: {_get_slot_name(0)} |  2: {_get_slot_name(1)} |  3: {_get_slot_name(2)} |
-      |                 |                 |                 |
-      +-----------------+-----------------+-----------------+
-    """
-
-    return textwrap.dedent(summary_)
+    return _SUMMARY_TEMPLATE.format(*(_get_slot_name(resource) for resource in self.slots),
+      size_x=self.get_size_x(), size_y=self.get_size_y())
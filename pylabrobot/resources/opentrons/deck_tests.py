@@ -40,3 +40,12 @@ class TestOTDeck(unittest.TestCase):
       |                 |                 |                 |
       +-----------------+-----------------+-----------------+
     """))
+
+  def test_get_slot(self):
+    plate = self.deck.get_resource("my_plate")
+    self.assertEqual(self.deck.get_slot(plate), 4)
+    self.assertIsNone(self.deck.get_slot(Cos_96_EZWash("my_plate")))
+
+    self.deck.unassign_child_resource(plate)
+    self.assertIsNone(self.deck.get_slot(plate))
+    self.assertIsNone(self.deck.slots[3])
@@ -5,7 +5,7 @@ import itertools
 import json
 import logging
 import sys
-from typing import Any, Callable, Dict, List, Optional, Type, cast
+from typing import Any, Callable, Dict, Iterator, List, Optional, Type, cast
 
 from .coordinate import Coordinate
 from .errors import ResourceNotFoundError
@@ -128,10 +128,20 @@ class Resource:
   def get_absolute_location(self) -> Coordinate:
     """ Get the absolute location of this resource, probably within the
     :class:`pylabrobot.resources.Deck`. """
-    assert self.location is not None, "Resource has no location."
-    if self.parent is None:
-      return self.location
-    return self.parent.get_absolute_location() + self.location
+
+    # Locations are public and may be mutated in place (e.g. by `rotate`), so the absolute location
+    # is not cached. Walk up the tree iteratively and add from the root down.
+    locations: List[Coordinate] = []
+    resource: Optional[Resource] = self
+    while resource is not None:
+      assert resource.location is not None, "Resource has no location."
+      locations.append(resource.location)
+      resource = resource.parent
+
+    absolute_location = locations.pop()
+    while len(locations) > 0:
+      absolute_location = absolute_location + locations.pop()
+    return absolute_location
 
   def get_size_x(self) -> float:
     if self.rotation in {90, 270}:
@@ -269,12 +279,18 @@ class Resource:
     if self.parent is not None:
       self.parent.unassign_child_resource(self)
 
+  def _iter_subtree(self) -> Iterator[Resource]:
+    """ Iterate over this resource and all of its descendants, depth-first in pre-order. An explicit
+    stack is used so deep trees do not hit the recursion limit. """
+    stack: List[Resource] = [self]
+    while len(stack) > 0:
+      resource = stack.pop()
+      yield resource
+      stack.extend(reversed(resource.children))
+
   def get_all_children(self) -> List[Resource]:
-    """ Recursively get all children of this resource. """
-    children = self.children.copy()
-    for child in self.children:
-      children += child.get_all_children()
-    return children
+    """ Get all descendants of this resource, depth-first in pre-order. """
+    return list(itertools.islice(self._iter_subtree(), 1, None))
 
   def get_resource(self, name: str) -> Resource:
     """ Get a resource by name.
@@ -289,14 +305,19 @@ class Resource:
       ValueError: If no resource with the given name exists.
     """
 
-    if self.name == name:
-      return self
-
-    for child in self.children:
-      try:
-        return child.get_resource(name)
-      except ResourceNotFoundError:
-        pass
+    stack: List[Resource] = [self]
+    while len(stack) > 0:
+      resource = stack.pop()
+      if resource.name == name:
+        return resource
+      # Descendants that override get_resource, such as Deck with its name index, are asked
+      # directly instead of having their subtree walked.
+      if resource is not self and type(resource).get_resource is not Resource.get_resource:
+        try:
+          return resource.get_resource(name)
+        except ResourceNotFoundError:
+          continue
+      stack.extend(reversed(resource.children))
 
     raise ResourceNotFoundError(f"Resource with name '{name}' does not exist.")
 
@@ -580,10 +601,7 @@ class Resource:
       states of the resources.
     """
 
-    state = {self.name: self.serialize_state()}
-    for child in self.children:
-      state.update(child.serialize_all_state())
-    return state
+    return {resource.name: resource.serialize_state() for resource in self._iter_subtree()}
 
   # Developer note: this method deserializes the state of this resource only. If you want to
   # deserialize a custom state for a resource, override this method in the subclass.
@@ -594,9 +612,8 @@ class Resource:
   # Developer note: you probably don't need to override this method. Instead, override `load_state`.
   def load_all_state(self, state: Dict[str, Dict[str, Any]]) -> None:
     """ Load state for this resource and all children. """
-    for child in self.children:
-      child.load_state(state[child.name])
-      child.load_all_state(state)
+    for resource in itertools.islice(self._iter_subtree(), 1, None):
+      resource.load_state(state[resource.name])
 
   def save_state_to_file(self, fn: str, indent: Optional[int] = None):
     """ Save the state of this resource and all children to a JSON file.
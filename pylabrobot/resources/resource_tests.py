@@ -95,6 +95,12 @@ class TestResource(unittest.TestCase):
 
     self.assertEqual(deck.get_all_children(), [parent, child])
 
+    sibling = Resource("sibling", size_x=5, size_y=5, size_z=5)
+    deck.assign_child_resource(sibling, location=Coordinate(50, 50, 50))
+    self.assertEqual(deck.get_all_children(), [parent, child, sibling])
+    self.assertEqual(parent.get_all_children(), [child])
+    self.assertEqual(list(deck.serialize_all_state()), ["deck", "parent", "child", "sibling"])
+
   def test_eq(self):
     deck1 = Deck()
     deck2 = Deck()
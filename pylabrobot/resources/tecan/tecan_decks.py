@@ -144,51 +144,51 @@ class TecanDeck(Deck):
           │   ├── tip_rack_01            STF_L               (x: 117.900, y: 240.000, z: 100.000)
     """
 
-    if len(self.get_all_resources()) == 0:
+    if len(self.resources) == 0:
       raise ValueError(
           "This liquid editor does not have any resources yet. "
           "Build a layout first by calling `assign_child_resource()`. "
       )
 
-    # Print header.
-    summary_ = "Rail" + " " * 5 + "Resource" + " " * 19 +  "Type" + " " * 16 + "Coordinates (mm)\n"
-    summary_ += "=" * 95 + "\n"
+    # Lines are collected in a list and joined once at the end.
+    lines = [
+      "Rail" + " " * 5 + "Resource" + " " * 19 +  "Type" + " " * 16 + "Coordinates (mm)",
+      "=" * 95,
+    ]
 
     def parse_resource(resource): # pylint: disable=invalid-name
       # TODO: print something else if resource is not assigned to a rails.
       rails = self._rails_for_x_coordinate(resource.location.x)
       rail_label = f"({rails})" if rails is not None else "     "
-      r_summary = f"{rail_label:4} ├── {resource.name:27}" + \
-            f"{resource.__class__.__name__:20}" + \
-            f"{resource.get_absolute_location()}\n"
+      lines.append(f"{rail_label:4} ├── {resource.name:27}"
+                   f"{resource.__class__.__name__:20}"
+                   f"{resource.get_absolute_location()}")
 
       if isinstance(resource, Carrier):
         for site in resource.get_sites():
           if site.resource is None:
-            r_summary += "     │   ├── <empty>\n"
+            lines.append("     │   ├── <empty>")
           else:
             subresource = site.resource
             if isinstance(subresource, (TipRack, Plate)):
-              location = subresource.get_item("A1").get_absolute_location() + \
-                subresource.get_item("A1").center()
+              a1 = subresource.get_item("A1")
+              location = a1.get_absolute_location() + a1.center()
             else:
               location = subresource.get_absolute_location()
-            r_summary += f"     │   ├── {subresource.name:23}" + \
-                  f"{subresource.__class__.__name__:20}" + \
-                  f"{location}\n"
-
-      return r_summary
+            lines.append(f"     │   ├── {subresource.name:23}"
+                         f"{subresource.__class__.__name__:20}"
+                         f"{location}")
 
     # Sort resources by rails, left to right in reality.
     sorted_resources = sorted(self.children, key=lambda r: r.get_absolute_location().x)
 
     # Print table body.
-    summary_ += parse_resource(sorted_resources[0])
+    parse_resource(sorted_resources[0])
     for resource in sorted_resources[1:]:
-      summary_ += "     │\n"
-      summary_ += parse_resource(resource)
+      lines.append("     │")
+      parse_resource(resource)
 
-    return summary_
+    return "\n".join(lines) + "\n"
 
 # pylint: disable=invalid-name
 def EVO100Deck(origin: Coordinate = Coordinate(0, 0, 0)) -> TecanDeck:
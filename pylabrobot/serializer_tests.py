@@ -0,0 +1,18 @@
+""" Tests for the serializer """
+
+import unittest
+
+from pylabrobot.liquid_handling.backends import STAR
+from pylabrobot.resources import Plate
+from pylabrobot.serializer import get_plr_class_from_string
+
+
+class TestSerializer(unittest.TestCase):
+  """ Tests for the serializer """
+
+  def test_get_plr_class_from_string(self):
+    self.assertIs(get_plr_class_from_string("Plate"), Plate)
+    # hardware backends are imported lazily, but should still be found
+    self.assertIs(get_plr_class_from_string("STAR"), STAR)
+    with self.assertRaises(ValueError):
+      get_plr_class_from_string("NotAClass")
@@ -3,32 +3,51 @@
 All are based on the seemingly arbitrary use of ascii escape characters.
 """
 
-import itertools
+import functools
+import re
+from typing import Iterator, Pattern
+
+# Keys and values are separated by ascii control characters (0x00-0x1f).
+_CONTROL = "\x00-\x1f"
+_UNTIL_CONTROL = re.compile(f"[^{_CONTROL}]*")
+
+
+@functools.lru_cache(maxsize=None)
+def _key_pattern(key: str) -> Pattern[str]:
+  """ A pattern matching `key` enclosed in control characters, capturing the value after it. """
+  return re.compile(f"[{_CONTROL}]{re.escape(key)}[{_CONTROL}]([^{_CONTROL}]*)")
+
+
+def _values(key: str, c: str) -> Iterator[str]:
+  """ Yield the value after every control character delimited occurrence of `key` in `c`. """
+  for match in _key_pattern(key).finditer(c):
+    yield match.group(1)
 
 
 def find_int(key, c):
-  for i, j, k in itertools.product(range(16*2), range(16*2), range(16*2)):
+  for value in _values(key, c):
     try:
-      return int(c.split(chr(i) + key + chr(j))[1].split(chr(k))[0])
-    except (IndexError, ValueError):
+      return int(value)
+    except ValueError:
       continue
   raise ValueError(f"Could not find '{key}'")
 
 
 def find_float(key, c):
-  for i, j, k in itertools.product(range(16*2), range(16*2), range(16*2)):
+  for value in _values(key, c):
     try:
-      return float(c.split(chr(i) + key + chr(j))[1].split(chr(k))[0])
-    except (IndexError, ValueError):
+      return float(value)
+    except ValueError:
       continue
   raise ValueError(f"Could not find '{key}'")
 
 
 def find_string(key, c):
-  finds = []
-  for i in range(32):
-    try:
-      finds.append(c.split(key)[1][1:].split(chr(i))[0])
-    except (IndexError, ValueError):
-      continue
-  return min(finds, key=len)
+  # The value starts one character (the length byte) after the first occurrence of `key` and runs
+  # until the next control character.
+  start = c.find(key)
+  if start == -1:
+    raise ValueError(f"Could not find '{key}'")
+  match = _UNTIL_CONTROL.match(c, start + len(key) + 1)
+  assert match is not None # the pattern also matches the empty string
+  return match.group(0)
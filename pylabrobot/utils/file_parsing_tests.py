@@ -0,0 +1,33 @@
+""" Tests for file parsing """
+
+import unittest
+
+from pylabrobot.utils.file_parsing import find_int, find_float, find_string
+
+
+class TestFileParsing(unittest.TestCase):
+  """ Tests for the Hamilton file parsing utilities. """
+
+  def setUp(self) -> None:
+    super().setUp()
+    # Keys and values are prefixed with their length as a control character.
+    self.c = "\x011\x0bLabware.Cnt\x0221\x13Labware.1.TForm.3.X\x05778.5" \
+             "\x04Deck\x0eML_Starlet.dck\x0bDefaultWash"
+
+  def test_find_int(self):
+    self.assertEqual(find_int("Labware.Cnt", self.c), 21)
+    with self.assertRaises(ValueError):
+      find_int("Labware.1.TForm.3.X", self.c)
+    with self.assertRaises(ValueError):
+      find_int("Missing", self.c)
+
+  def test_find_float(self):
+    self.assertEqual(find_float("Labware.1.TForm.3.X", self.c), 778.5)
+    self.assertEqual(find_float("Labware.Cnt", self.c), 21.0)
+    with self.assertRaises(ValueError):
+      find_float("Missing", self.c)
+
+  def test_find_string(self):
+    self.assertEqual(find_string("Deck", self.c), "ML_Starlet.dck")
+    with self.assertRaises(ValueError):
+      find_string("Missing", self.c)
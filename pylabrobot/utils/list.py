@@ -36,14 +36,8 @@ def reshape_2d(list_: List[T], shape: Tuple[int, int]) -> List[List[T]]:
   if not len(list_) == shape[0] * shape[1]:
     raise ValueError(f"Cannot reshape list {list_} into shape {shape}")
 
-  new_list: List[List[T]] = []
-
-  for i in range(shape[0]):
-    new_list.append([])
-    for j in range(shape[1]):
-      new_list[i].append(list_[i * shape[1] + j])
-
-  return new_list
+  row_length = shape[1]
+  return [list_[i * row_length:(i + 1) * row_length] for i in range(shape[0])]
 
 
 def expand(list_or_item: Union[Sequence[T], T], n: int) -> List[T]: